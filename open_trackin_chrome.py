@@ -1,23 +1,41 @@
 #!/usr/bin/env python3
 """Open trackin.post.ir in Google Chrome if available."""
+import functools
 import webbrowser
-import shutil
+from typing import Optional
 
 URL = "https://trackin.post.ir"
 
-def open_in_chrome(url: str) -> bool:
-    """Try to open the given URL in Chrome and return True if succeeded."""
-    potential = [
-        "google-chrome",
-        "chrome",
-        "chromium",
-        "google-chrome-stable",
-    ]
-    for name in potential:
+CHROME_NAMES = (
+    "google-chrome",
+    "chrome",
+    "chromium",
+    "google-chrome-stable",
+)
+
+@functools.lru_cache(maxsize=1)
+def _find_chrome() -> Optional[str]:
+    """Locate a Chrome executable on $PATH, scanning only once."""
+    import shutil
+
+    for name in CHROME_NAMES:
         path = shutil.which(name)
         if path:
-            webbrowser.get(f"{path} %s").open(url)
-            return True
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _chrome_browser(path: str) -> webbrowser.BaseBrowser:
+    return webbrowser.get(f"{path} %s")
+
+
+def open_in_chrome(url: str) -> bool:
+    """Try to open the given URL in Chrome and return True if succeeded."""
+    path = _find_chrome()
+    if path:
+        _chrome_browser(path).open(url)
+        return True
     return False
 
 
@@ -8,9 +8,19 @@ with group (round robin) and knockout stages.
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple
 import math
-import itertools
+import re
 
-@dataclass
+_SET_RE = re.compile(r"(\d+)\s*-\s*(\d+)")
+
+
+def _parse_sets(s: str) -> Optional[List[Tuple[int, int]]]:
+    """Parse a score string like "11-7,7-11,11-9" into set tuples.
+
+    Returns None when no set scores are found.
+    """
+    return [(int(a), int(b)) for a, b in _SET_RE.findall(s)] or None
+
+@dataclass(eq=False, slots=True)
 class Player:
     name: str
     seed: int = 0
@@ -18,94 +28,170 @@ class Player:
     id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     player1: Player
     player2: Player
     scores: List[Tuple[int, int]]  # list of tuples (p1_score, p2_score)
+    _p1_sets: int = field(init=False, repr=False)
+    _p2_sets: int = field(init=False, repr=False)
+    _winner: Player = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Scores never change after construction, so tally the sets and
+        # decide the winner once instead of on every access.
+        p1_sets = p2_sets = 0
+        for a, b in self.scores:
+            if a > b:
+                p1_sets += 1
+            elif b > a:
+                p2_sets += 1
+        self._p1_sets = p1_sets
+        self._p2_sets = p2_sets
+        self._winner = self.player1 if p1_sets > p2_sets else self.player2
 
     @property
     def winner(self) -> Player:
-        p1_sets = sum(1 for a, b in self.scores if a > b)
-        p2_sets = sum(1 for a, b in self.scores if b > a)
-        return self.player1 if p1_sets > p2_sets else self.player2
+        return self._winner
+
+
+def round_robin_rounds(players: List[Player]) -> List[List[Tuple[Player, Player]]]:
+    """Build a round robin schedule using the circle method.
+
+    Returns n-1 rounds of n//2 matches each so that no player appears
+    twice in the same round (a bye is inserted when n is odd).
+    """
+    ps = list(players)
+    if len(ps) % 2:
+        ps.append(None)  # bye
+    n = len(ps)
+    rounds = []
+    for _ in range(n - 1):
+        pairs = [(ps[i], ps[n - 1 - i]) for i in range(n // 2)]
+        rounds.append([(a, b) for a, b in pairs if a is not None and b is not None])
+        ps = [ps[0], ps[-1]] + ps[1:-1]
+    return rounds
 
 
 def snake_seed(players: List[Player], group_count: int) -> Dict[str, List[Player]]:
     """Distribute players into groups using snake seeding."""
     groups = {f"G{i+1}": [] for i in range(group_count)}
-    direction = 1
-    group_index = 0
-    for p in sorted(players, key=lambda x: x.seed):
-        key = f"G{group_index+1}"
-        groups[key].append(p)
-        group_index += direction
-        if group_index == group_count:
-            direction = -1
-            group_index = group_count - 1
-        elif group_index < 0:
-            direction = 1
-            group_index = 0
+    for i, p in enumerate(sorted(players, key=lambda x: x.seed)):
+        row, col = divmod(i, group_count)
+        idx = col if row % 2 == 0 else group_count - 1 - col
+        groups[f"G{idx+1}"].append(p)
     return groups
 
-@dataclass
+@dataclass(slots=True)
 class Group:
     name: str
     players: List[Player]
     matches: List[MatchResult] = field(default_factory=list)
+    rounds: List[List[Tuple[Player, Player]]] = field(init=False, repr=False)
+    schedule: List[Tuple[Player, Player]] = field(init=False, repr=False)
+    _points: List[int] = field(init=False, repr=False)
+    _player_index: Dict[Player, int] = field(init=False, repr=False)
+    _played: set = field(init=False, repr=False)
+    _standings_cache: Optional[List[Tuple[Player, int, int]]] = field(init=False, repr=False)
+    _dirty: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._points = [0] * len(self.players)
+        self._player_index = {p: i for i, p in enumerate(self.players)}
+        self._played = set()
+        self.rounds = []
+        self.schedule = []
+        self._standings_cache = None
+        self._dirty = True
 
     def schedule_matches(self) -> List[Tuple[Player, Player]]:
-        combos = list(itertools.combinations(self.players, 2))
-        return combos
+        self.rounds = round_robin_rounds(self.players)
+        self.schedule = [pair for rnd in self.rounds for pair in rnd]
+        return self.schedule
 
     def record_result(self, p1: Player, p2: Player, scores: List[Tuple[int, int]]):
-        self.matches.append(MatchResult(p1, p2, scores))
+        key = frozenset((p1, p2))
+        if key in self._played:
+            return  # pairing already recorded
+        self._played.add(key)
+        mr = MatchResult(p1, p2, scores)
+        self.matches.append(mr)
+        winner = mr.winner
+        loser = p2 if winner is p1 else p1
+        self._points[self._player_index[winner]] += 2
+        self._points[self._player_index[loser]] += 1
+        self._dirty = True
+
+    def is_complete(self) -> bool:
+        return bool(self.schedule) and len(self._played) == len(self.schedule)
 
     def standings(self) -> List[Tuple[Player, int, int]]:
-        points: Dict[Player, int] = {p: 0 for p in self.players}
-        for match in self.matches:
-            winner = match.winner
-            loser = match.player1 if winner is match.player2 else match.player2
-            points[winner] += 2
-            points[loser] += 1
-        standings = sorted(points.items(), key=lambda x: (-x[1], x[0].seed))
-        return [(p, pts, i) for i, (p, pts) in enumerate(standings, 1)]
-
-@dataclass
+        if not self._dirty and self._standings_cache is not None:
+            return self._standings_cache
+        pairs = [(self.players[i], pts) for i, pts in enumerate(self._points)]
+        standings = sorted(pairs, key=lambda x: (-x[1], x[0].seed))
+        self._standings_cache = [(p, pts, i) for i, (p, pts) in enumerate(standings, 1)]
+        self._dirty = False
+        return self._standings_cache
+
+@dataclass(slots=True)
 class KnockoutMatch:
     player1: Optional[Player]
     player2: Optional[Player]
     result: Optional[MatchResult] = None
 
-@dataclass
+@dataclass(slots=True)
 class KnockoutBracket:
     rounds: List[List[KnockoutMatch]] = field(default_factory=list)
+    bracket_size: int = 0
+    _champion_cache: Optional[Player] = field(init=False, repr=False)
+    _dirty: bool = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if not self.bracket_size and self.rounds:
+            self.bracket_size = 2 * len(self.rounds[0])
+        self._champion_cache = None
+        self._dirty = True
 
     @classmethod
     def from_players(cls, players: List[Player]):
-        size = 1
-        while size < len(players):
-            size *= 2
-        bracket_players = players + [None] * (size - len(players))
+        n = len(players)
+        size = 1 if n <= 1 else 1 << (n - 1).bit_length()
+        bracket_players = players + [None] * (size - n)
         matches = [KnockoutMatch(bracket_players[i], bracket_players[i+1])
                    for i in range(0, size, 2)]
-        rounds = [matches]
-        while size > 1:
-            size //= 2
-            matches = [KnockoutMatch(None, None) for _ in range(size//2)]
-            rounds.append(matches)
-        return cls(rounds)
+        # Later rounds are created on demand as winners advance.
+        return cls([matches], size)
+
+    def _advance(self, round_index: int, match_index: int, winner: Player):
+        current = self.rounds[round_index]
+        if len(current) == 1:
+            return
+        if round_index + 1 == len(self.rounds):
+            self.rounds.append([KnockoutMatch(None, None)
+                                for _ in range(len(current) // 2)])
+        next_match = self.rounds[round_index+1][match_index//2]
+        if match_index % 2 == 0:
+            next_match.player1 = winner
+        else:
+            next_match.player2 = winner
 
     def record_result(self, round_index: int, match_index: int, scores: List[Tuple[int, int]]):
         match = self.rounds[round_index][match_index]
         match.result = MatchResult(match.player1, match.player2, scores)
-        winner = match.result.winner
-        if round_index + 1 < len(self.rounds):
-            next_match = self.rounds[round_index+1][match_index//2]
-            if match_index % 2 == 0:
-                next_match.player1 = winner
-            else:
-                next_match.player2 = winner
+        self._advance(round_index, match_index, match.result.winner)
+        self._dirty = True
+
+    def champion(self) -> Optional[Player]:
+        if not self._dirty and self._champion_cache is not None:
+            return self._champion_cache
+        if len(self.rounds[-1]) != 1:
+            return None  # final round not reached yet
+        final = self.rounds[-1][0]
+        champion = final.result.winner if final.result else (final.player1 or final.player2)
+        self._champion_cache = champion
+        self._dirty = False
+        return champion
 
 class Tournament:
     def __init__(self, players: List[Player], group_count: int = 4, advance_per_group: int = 2):
@@ -145,6 +231,13 @@ if __name__ == "__main__":
     parser.add_argument('--advance', type=int, default=2, help='Number advancing from each group')
     args = parser.parse_args()
 
+    def prompt_sets() -> List[Tuple[int, int]]:
+        while True:
+            sets = _parse_sets(input().strip())
+            if sets:
+                return sets
+            print("Invalid score format, try again (e.g. 11-7,7-11,11-9):")
+
     players = [Player(name, seed=i+1) for i, name in enumerate(args.players)]
     t = Tournament(players, group_count=args.groups, advance_per_group=args.advance)
 
@@ -153,12 +246,12 @@ if __name__ == "__main__":
         print(f"\nGroup {g.name}")
         for p in g.players:
             print(f"  {p.seed}. {p.name}")
-        schedule = g.schedule_matches()
-        for p1, p2 in schedule:
-            print(f"Enter result for {p1.name} vs {p2.name} (comma separated sets e.g. 11-7,7-11,11-9):")
-            line = input().strip()
-            sets = [(int(a), int(b)) for a,b in (s.split('-') for s in line.split(','))]
-            g.record_result(p1, p2, sets)
+        g.schedule_matches()
+        for rnd_no, rnd in enumerate(g.rounds, 1):
+            print(f"Round {rnd_no}")
+            for p1, p2 in rnd:
+                print(f"Enter result for {p1.name} vs {p2.name} (comma separated sets e.g. 11-7,7-11,11-9):")
+                g.record_result(p1, p2, prompt_sets())
         standings = g.standings()
         print("Standings:")
         for player, pts, pos in standings:
@@ -169,25 +262,17 @@ if __name__ == "__main__":
     for p in advancing:
         print(p.name)
     bracket = t.create_bracket(advancing)
-    # display round names
-    round_names = ["Round of {}".format(len(r)*2) for r in bracket.rounds]
-    for rnd, name in enumerate(round_names):
-        print(f"\n{name}")
+    rnd = 0
+    while rnd < len(bracket.rounds):  # rounds are appended as winners advance
+        print("\nRound of {}".format(len(bracket.rounds[rnd])*2))
         for idx, match in enumerate(bracket.rounds[rnd]):
             if match.player1 and match.player2:
                 print(f"Enter result for {match.player1.name} vs {match.player2.name} sets:")
-                line = input().strip()
-                sets = [(int(a), int(b)) for a,b in (s.split('-') for s in line.split(','))]
-                bracket.record_result(rnd, idx, sets)
+                bracket.record_result(rnd, idx, prompt_sets())
             elif match.player1 or match.player2:
                 winner = match.player1 or match.player2
                 print(f"{winner.name} receives a bye")
-                if rnd + 1 < len(bracket.rounds):
-                    next_match = bracket.rounds[rnd+1][idx//2]
-                    if idx % 2 == 0:
-                        next_match.player1 = winner
-                    else:
-                        next_match.player2 = winner
-    final_round = bracket.rounds[-1][0]
-    champion = final_round.result.winner if final_round.result else (final_round.player1 or final_round.player2)
+                bracket._advance(rnd, idx, winner)
+        rnd += 1
+    champion = bracket.champion()
     print(f"\nChampion: {champion.name}")